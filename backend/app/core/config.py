@@ -16,6 +16,11 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO")
 
     database_url: str = Field(default="sqlite:///./poe2tradecraft.db")
+    database_query_cache_size: int = Field(default=1200)
+    database_pool_size: int = Field(default=5)
+    database_max_overflow: int = Field(default=10)
+    database_pool_timeout: int = Field(default=30)
+    database_pool_recycle: int = Field(default=1800)
     redis_url: str = Field(default="redis://localhost:6379/0")
 
     cors_origins: List[str] = Field(
@@ -1,10 +1,50 @@
+from typing import Any, Dict
+
+import orjson
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.database_url)
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson (C) instead of stdlib json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """Engine options tuned for bulk seeding (executemany paging, statement cache) and pooling."""
+    url = make_url(database_url)
+    options: Dict[str, Any] = {
+        "insertmanyvalues_page_size": 1000,
+        # Keep compiled INSERT/SELECT statements for every crafting table
+        # around across repeated seed runs and request handlers
+        "query_cache_size": settings.database_query_cache_size,
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
+    }
+
+    if url.get_backend_name() != "sqlite":
+        # Server databases: reuse a bounded pool of connections, drop ones the
+        # server closed while idle instead of failing the next statement
+        options["pool_size"] = settings.database_pool_size
+        options["max_overflow"] = settings.database_max_overflow
+        options["pool_timeout"] = settings.database_pool_timeout
+        options["pool_recycle"] = settings.database_pool_recycle
+        options["pool_pre_ping"] = True
+
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg2":
+        # Fold plain executemany (UPDATE/DELETE and INSERTs without RETURNING)
+        # into psycopg2's execute_batch pages instead of one round trip per row
+        options["executemany_mode"] = "values_plus_batch"
+        options["executemany_batch_page_size"] = 500
+
+    return options
+
+
+engine = create_engine(settings.database_url, **_engine_options(settings.database_url))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -15,4 +55,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
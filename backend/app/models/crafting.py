@@ -172,6 +172,14 @@ class CurrencyConfig(Base):
     config_data = Column(JSON, default={})  # min_mod_level, mod_count, etc.
 
 
+class SeedVersion(Base):
+    __tablename__ = "seed_versions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False, unique=True, index=True)  # source_data filename, e.g. "omens.json"
+    content_hash = Column(String(64), nullable=False)  # sha256 of that file as last loaded
+
+
 class CraftingProject(Base):
     __tablename__ = "crafting_projects"
 
@@ -5,6 +5,8 @@ This service loads all crafting configurations from the database and provides
 them to the crafting mechanics. Implements caching for performance.
 """
 
+import sys
+from collections import defaultdict
 from typing import Dict, List, Optional, Any
 from functools import lru_cache
 
@@ -32,6 +34,8 @@ class CraftingConfigService:
         self._omen_configs: Dict[str, OmenInfo] = {}
         self._bone_configs: Dict[str, DesecrationBoneInfo] = {}
         self._modifier_pools: Dict[str, ModifierPoolInfo] = {}
+        # Essences grouped by tier, rebuilt with the essence configs
+        self._essences_by_tier: Dict[str, List[EssenceInfo]] = {}
         self._loaded = False
 
     def ensure_loaded(self):
@@ -62,11 +66,11 @@ class CraftingConfigService:
             config_info = CurrencyConfigInfo(
                 id=config.id,
                 name=config.name,
-                currency_type=config.currency_type,
+                currency_type=sys.intern(config.currency_type),
                 tier=config.tier,
-                rarity=config.rarity,
+                rarity=sys.intern(config.rarity),
                 stack_size=config.stack_size,
-                mechanic_class=config.mechanic_class,
+                mechanic_class=sys.intern(config.mechanic_class),
                 config_data=config.config_data or {}
             )
             self._currency_configs[config.name] = config_info
@@ -84,8 +88,10 @@ class CraftingConfigService:
                 effect_schema = EssenceItemEffectSchema(
                     id=effect.id,
                     essence_id=effect.essence_id,
-                    item_type=effect.item_type,
-                    modifier_type=effect.modifier_type,
+                    # A handful of item/modifier types repeat across every
+                    # effect; intern them so cached configs share one copy
+                    item_type=sys.intern(effect.item_type),
+                    modifier_type=sys.intern(effect.modifier_type),
                     effect_text=effect.effect_text,
                     value_min=effect.value_min,
                     value_max=effect.value_max
@@ -95,14 +101,23 @@ class CraftingConfigService:
             essence_info = EssenceInfo(
                 id=essence.id,
                 name=essence.name,
-                essence_tier=essence.essence_tier,
-                essence_type=essence.essence_type,
-                mechanic=essence.mechanic,
+                essence_tier=sys.intern(essence.essence_tier),
+                essence_type=sys.intern(essence.essence_type),
+                mechanic=sys.intern(essence.mechanic),
                 stack_size=essence.stack_size,
                 item_effects=item_effects
             )
             self._essence_configs[essence.name] = essence_info
 
+        self._build_essence_tier_index()
+
+    def _build_essence_tier_index(self):
+        """Group the loaded essences by tier for get_essences_by_tier."""
+        by_tier = defaultdict(list)
+        for essence in self._essence_configs.values():
+            by_tier[essence.essence_tier].append(essence)
+        self._essences_by_tier = dict(by_tier)
+
     def _load_omen_configs(self, db: Session):
         """Load omen configurations from database."""
         omens = db.query(Omen).options(
@@ -126,8 +141,8 @@ class CraftingConfigService:
                 id=omen.id,
                 name=omen.name,
                 effect_description=omen.effect_description,
-                affected_currency=omen.affected_currency,
-                effect_type=omen.effect_type,
+                affected_currency=sys.intern(omen.affected_currency),
+                effect_type=sys.intern(omen.effect_type),
                 stack_size=omen.stack_size,
                 rules=rules
             )
@@ -141,8 +156,8 @@ class CraftingConfigService:
             bone_info = DesecrationBoneInfo(
                 id=bone.id,
                 name=bone.name,
-                bone_type=bone.bone_type,
-                bone_part=bone.bone_part,
+                bone_type=sys.intern(bone.bone_type),
+                bone_part=sys.intern(bone.bone_part),
                 mechanic=bone.mechanic,
                 stack_size=bone.stack_size,
                 applicable_items=bone.applicable_items or [],
@@ -244,10 +259,7 @@ class CraftingConfigService:
     def get_essences_by_tier(self, tier: str) -> List[EssenceInfo]:
         """Get all essences of a specific tier."""
         self.ensure_loaded()
-        return [
-            essence for essence in self._essence_configs.values()
-            if essence.essence_tier == tier
-        ]
+        return list(self._essences_by_tier.get(tier, []))
 
     def get_omens_for_currency(self, currency_name: str) -> List[OmenInfo]:
         """Get all omens that affect a specific currency (supports variants)."""
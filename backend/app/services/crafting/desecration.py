@@ -2,6 +2,7 @@ import random
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Dict
 from enum import Enum
+from itertools import product
 
 from app.schemas.crafting import CraftableItem, ItemModifier, ItemRarity, ModType
 from app.services.crafting.item_state import ItemStateManager
@@ -402,19 +403,15 @@ class DesecrationFactory:
     @staticmethod
     def get_all_bone_names() -> List[str]:
         """Get all available bone names."""
-        names = []
-
         bone_types = [
             AbyssalBoneType.JAWBONE, AbyssalBoneType.RIB, AbyssalBoneType.COLLARBONE,
             AbyssalBoneType.CRANIUM, AbyssalBoneType.VERTEBRAE
         ]
 
-        for bone_type in bone_types:
-            for quality in [BoneQuality.REGULAR, BoneQuality.ANCIENT]:
-                bone = DesecrationFactory.create_bone(bone_type, quality)
-                names.append(bone.name)
-
-        return names
+        return [
+            DesecrationFactory.create_bone(bone_type, quality).name
+            for bone_type, quality in product(bone_types, (BoneQuality.REGULAR, BoneQuality.ANCIENT))
+        ]
 
 
 class WellOfSouls:
@@ -5,10 +5,12 @@ Loads exclusion rules from exclusion_groups.json and provides validation
 to prevent conflicting mods from being added to items.
 """
 
-import json
 import re
 from pathlib import Path
 from typing import List, Optional, Set
+
+import orjson
+
 from app.schemas.crafting import ItemModifier
 from app.core.logging import get_logger
 
@@ -31,8 +33,7 @@ class ExclusionService:
             return
 
         try:
-            with open(exclusion_file, 'r', encoding='utf-8') as f:
-                self.exclusion_rules = json.load(f)
+            self.exclusion_rules = orjson.loads(exclusion_file.read_bytes())
             logger.info(f"Loaded {len(self.exclusion_rules)} exclusion rules")
         except Exception as e:
             logger.error(f"Failed to load exclusion rules: {e}")
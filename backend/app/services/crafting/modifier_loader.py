@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from typing import List
 from sqlalchemy.orm import sessionmaker
 
@@ -11,6 +13,17 @@ logger = get_logger(__name__)
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# "(min-max)" ranges and bare numbers in essence effect text, e.g. "+(30-39) to maximum Life"
+_RANGE_PATTERN = re.compile(r'\(\d+(\.\d+)?-\d+(\.\d+)?\)')
+_NUMBER_PATTERN = re.compile(r'\d+(\.\d+)?')
+
+
+@lru_cache(maxsize=None)
+def _stat_template(effect_text: str) -> str:
+    """Turn essence effect text into the modifier stat_text template form ({} placeholders)."""
+    # First replace (min-max) patterns with {}, then replace remaining individual numbers
+    return _NUMBER_PATTERN.sub('{}', _RANGE_PATTERN.sub('{}', effect_text))
+
 
 class ModifierLoader:
     """Database-based modifier loader with caching."""
@@ -177,12 +190,8 @@ class ModifierLoader:
     @classmethod
     def _find_matching_modifier_for_essence(cls, effect: EssenceItemEffect, applicable_items: List[str]) -> ItemModifier | None:
         """Try to find an existing modifier that matches the essence effect."""
-        import re
-
         # Normalize the effect text to match mod templates (replace specific values with {})
-        # First replace (min-max) patterns with {}, then replace remaining individual numbers
-        normalized_effect = re.sub(r'\(\d+(\.\d+)?-\d+(\.\d+)?\)', '{}', effect.effect_text)
-        normalized_effect = re.sub(r'\d+(\.\d+)?', '{}', normalized_effect)
+        normalized_effect = _stat_template(effect.effect_text)
 
         # Look for stat_text match with matching values in already-loaded modifiers
         for mod in cls._modifiers:
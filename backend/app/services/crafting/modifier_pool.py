@@ -1,11 +1,73 @@
 import random
-import json
 import os
+from functools import lru_cache
 from typing import List, Optional
 
+import orjson
+
 from app.schemas.crafting import ItemModifier, ModType
 from app.services.crafting.exclusion_service import exclusion_service
 
+# Go up from app/services/crafting to backend, then to source_data
+SOURCE_DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+    "source_data"
+)
+
+
+# Our detailed weapon categories to PoB weapon types
+# PoB uses generic weapon types (sword, axe, mace) without one/two-handed distinction
+WEAPON_CATEGORY_MAP = {
+    # One-handed weapons
+    "Wand": "wand",
+    "Dagger": "dagger",
+    "Spear": "spear",
+    "Sceptre": "sceptre",
+    "One Handed Axe": "axe",
+    "One Handed Mace": "mace",
+    "One Handed Sword": "sword",
+    "Flail": "flail",
+    "Claw": "claw",
+    # Two-handed weapons
+    "Bow": "bow",
+    "Crossbow": "crossbow",
+    "Staff": "staff",
+    "Two Handed Axe": "axe",
+    "Two Handed Mace": "mace",
+    "Two Handed Sword": "sword",
+    "Warstaff": "warstaff",
+    # Test category names (snake_case)
+    "one_hand_sword": "sword",
+    "one_hand_axe": "axe",
+    "one_hand_mace": "mace",
+    "claw": "claw",
+    "two_hand_sword": "sword",
+    "two_hand_axe": "axe",
+    "two_hand_mace": "mace",
+}
+
+
+@lru_cache(maxsize=None)
+def _load_source_json(filename: str):
+    """Parse a source_data JSON file once per process (None if it doesn't exist).
+
+    The result is shared between callers and must be treated as read-only.
+    """
+    path = os.path.join(SOURCE_DATA_DIR, filename)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+@lru_cache(maxsize=None)
+def _item_bases_by_name() -> dict:
+    """generated_item_bases.json keyed by base name (first entry wins, as a scan would)."""
+    by_name = {}
+    for base in _load_source_json("generated_item_bases.json") or []:
+        by_name.setdefault(base.get('name'), base)
+    return by_name
+
 
 class ModifierPool:
     def __init__(self, modifiers: List[ItemModifier]) -> None:
@@ -20,15 +82,9 @@ class ModifierPool:
     def _load_exclusions(self) -> List[dict]:
         """Load modifier exclusions from JSON file."""
         try:
-            # Go up from app/services/crafting to backend, then to source_data
-            exclusions_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-                "source_data",
-                "modifier_exclusions.json"
-            )
-            if os.path.exists(exclusions_path):
-                with open(exclusions_path, 'r') as f:
-                    return json.load(f)
+            exclusions = _load_source_json("modifier_exclusions.json")
+            if exclusions is not None:
+                return exclusions
         except Exception as e:
             print(f"Warning: Could not load modifier exclusions: {e}")
         return []
@@ -36,16 +92,9 @@ class ModifierPool:
     def _load_exclusion_groups(self) -> dict:
         """Load exclusion groups configuration from JSON file."""
         try:
-            # Go up from app/services/crafting to backend, then to source_data
-            groups_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-                "source_data",
-                "exclusion_groups.json"
-            )
-            if os.path.exists(groups_path):
-                with open(groups_path, 'r') as f:
-                    data = json.load(f)
-                    return data.get("groups", {})
+            data = _load_source_json("exclusion_groups.json")
+            if data is not None:
+                return data.get("groups", {})
         except Exception as e:
             print(f"Warning: Could not load exclusion groups: {e}")
         return {}
@@ -515,25 +564,9 @@ class ModifierPool:
             return []
 
         # Read implicit from JSON file (not in database model yet)
-        import json
-        import os
-
-        # Get path to item bases JSON
-        json_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-            "source_data",
-            "generated_item_bases.json"
-        )
-
-        if not os.path.exists(json_path):
-            return []
-
         try:
-            with open(json_path, 'r') as f:
-                bases = json.load(f)
-
             # Find base item
-            base_item = next((b for b in bases if b.get('name') == item.base_name), None)
+            base_item = _item_bases_by_name().get(item.base_name)
             if not base_item or not base_item.get('implicit'):
                 return []
 
@@ -804,38 +837,8 @@ class ModifierPool:
                 return True
 
         # Handle weapon category mapping (our detailed categories to PoB weapon types)
-        # PoB uses generic weapon types (sword, axe, mace) without one/two-handed distinction
-        weapon_category_map = {
-            # One-handed weapons
-            "Wand": "wand",
-            "Dagger": "dagger",
-            "Spear": "spear",
-            "Sceptre": "sceptre",
-            "One Handed Axe": "axe",
-            "One Handed Mace": "mace",
-            "One Handed Sword": "sword",
-            "Flail": "flail",
-            "Claw": "claw",
-            # Two-handed weapons
-            "Bow": "bow",
-            "Crossbow": "crossbow",
-            "Staff": "staff",
-            "Two Handed Axe": "axe",
-            "Two Handed Mace": "mace",
-            "Two Handed Sword": "sword",
-            "Warstaff": "warstaff",
-            # Test category names (snake_case)
-            "one_hand_sword": "sword",
-            "one_hand_axe": "axe",
-            "one_hand_mace": "mace",
-            "claw": "claw",
-            "two_hand_sword": "sword",
-            "two_hand_axe": "axe",
-            "two_hand_mace": "mace",
-        }
-
-        if item_category in weapon_category_map:
-            pob_weapon_type = weapon_category_map[item_category]
+        if item_category in WEAPON_CATEGORY_MAP:
+            pob_weapon_type = WEAPON_CATEGORY_MAP[item_category]
             if pob_weapon_type in mod.applicable_items:
                 return True
 
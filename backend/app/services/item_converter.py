@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional, List
 import re
 
@@ -10,6 +11,36 @@ from app.services.stat_calculator import StatCalculator
 
 logger = get_logger(__name__)
 
+# Trailing markers like (desecrated), (fractured), (Placeholder for Desecration)
+_MOD_MARKER_PATTERN = re.compile(r'\s*\((desecrated|fractured|corrupted|placeholder[^)]*)\)\s*$', re.IGNORECASE)
+# Ranges like (101-110)
+_INT_RANGE_PATTERN = re.compile(r'\(\d+-\d+\)')
+_FIRST_NUMBER_PATTERN = re.compile(r'(\d+(?:\.\d+)?)')
+
+
+@lru_cache(maxsize=None)
+def _stat_text_pattern(stat_text: str) -> re.Pattern:
+    """Compile a full-match regex for a modifier stat_text template.
+
+    Built once per template: there are more modifier templates than the re
+    module's internal pattern cache holds, so compiling inline recompiled
+    them on every mod conversion.
+    """
+    # Build pattern by escaping the stat_text but preserving the {} placeholder
+    # Then replace {} with a pattern that matches: number + optional (min-max) range
+
+    # Split by {} to escape the text parts separately
+    parts = stat_text.lower().split('{}')
+    escaped_parts = [re.escape(part) for part in parts]
+
+    # Join with pattern for number + optional range, supporting decimals
+    # Pattern: \d+(?:\.\d+)?(?:\(\d+(?:\.\d+)?-\d+(?:\.\d+)?\))?
+    # Matches: 111, 11.4, 111(100-119), 11.4(9.1-13)
+    pattern = r'\d+(?:\.\d+)?(?:\(\d+(?:\.\d+)?-\d+(?:\.\d+)?\))?'.join(escaped_parts)
+
+    # Use full string matching with anchors to avoid partial matches
+    return re.compile(f'^{pattern}$')
+
 
 class ItemConverter:
     def __init__(self, modifier_pool: ModifierPool):
@@ -189,30 +220,14 @@ class ItemConverter:
         # Match by stat text pattern
         # Strip special markers like (desecrated), (fractured), (Placeholder for Desecration), etc.
         parsed_text = item_mod.text.lower()
-        parsed_text = re.sub(r'\s*\((desecrated|fractured|corrupted|placeholder[^)]*)\)\s*$', '', parsed_text, flags=re.IGNORECASE).strip()
+        parsed_text = _MOD_MARKER_PATTERN.sub('', parsed_text).strip()
 
         # Sort candidates by specificity (longer stat_text first) to match more specific mods first
         # This prevents "+{} to Accuracy Rating" from matching before "Allies in your Presence have +{} to Accuracy Rating"
         candidates = sorted(candidates, key=lambda m: len(m.stat_text), reverse=True)
 
         for candidate in candidates:
-            # Build pattern by escaping the stat_text but preserving the {} placeholder
-            # Then replace {} with a pattern that matches: number + optional (min-max) range
-            stat_text_lower = candidate.stat_text.lower()
-
-            # Split by {} to escape the text parts separately
-            parts = stat_text_lower.split('{}')
-            escaped_parts = [re.escape(part) for part in parts]
-
-            # Join with pattern for number + optional range, supporting decimals
-            # Pattern: \d+(?:\.\d+)?(?:\(\d+(?:\.\d+)?-\d+(?:\.\d+)?\))?
-            # Matches: 111, 11.4, 111(100-119), 11.4(9.1-13)
-            pattern = r'\d+(?:\.\d+)?(?:\(\d+(?:\.\d+)?-\d+(?:\.\d+)?\))?'.join(escaped_parts)
-
-            # Use full string matching with anchors to avoid partial matches
-            full_pattern = f'^{pattern}$'
-
-            if re.match(full_pattern, parsed_text):
+            if _stat_text_pattern(candidate.stat_text).match(parsed_text):
                 # Check if the value falls within the mod's range
                 current_value = self._extract_value_from_text(item_mod.text)
 
@@ -246,9 +261,9 @@ class ItemConverter:
     def _extract_value_from_text(self, text: str) -> Optional[float]:
         """Extract the first numeric value from mod text"""
         # Remove parentheses with ranges like (101-110)
-        text_no_ranges = re.sub(r'\(\d+-\d+\)', '', text)
+        text_no_ranges = _INT_RANGE_PATTERN.sub('', text)
 
-        match = re.search(r'(\d+(?:\.\d+)?)', text_no_ranges)
+        match = _FIRST_NUMBER_PATTERN.search(text_no_ranges)
         if match:
             return float(match.group(1))
         return None
\ No newline at end of file
@@ -9,19 +9,38 @@ Run this before populating data.
 import sys
 import os
 
-# Change to backend directory to ensure database is created there
-backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-os.chdir(backend_dir)
-sys.path.insert(0, backend_dir)
+# Run as a plain file (python scripts/...): change to backend directory to
+# ensure database is created there, and make the app package importable.
+# Not needed under python -m scripts.<name> from backend/ or when imported
+if not __package__:
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(backend_dir)
+    sys.path.insert(0, backend_dir)
+
+from sqlalchemy import text
 
 from app.models.base import Base, engine
 from app.models.crafting import (
     BaseItem, Modifier, Essence, EssenceItemEffect,
     Omen, OmenRule, DesecrationBone, ModifierPool, PoolModifier,
-    CurrencyConfig, CraftingProject
+    CurrencyConfig, SeedVersion, CraftingProject
 )
 
 
+def drop_all_tables():
+    """Drop every model table.
+
+    On PostgreSQL this is a single DROP TABLE ... CASCADE statement instead of
+    one DROP per table in dependency order; other databases use drop_all.
+    """
+    if engine.dialect.name == "postgresql":
+        table_names = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {table_names} CASCADE"))
+    else:
+        Base.metadata.drop_all(bind=engine)
+
+
 def create_all_tables():
     """Create all database tables."""
     print(f"Working directory: {os.getcwd()}")
@@ -30,7 +49,7 @@ def create_all_tables():
     try:
         # Drop all existing tables first
         print("Dropping existing tables...")
-        Base.metadata.drop_all(bind=engine)
+        drop_all_tables()
 
         # Create all tables
         print("Creating fresh tables...")
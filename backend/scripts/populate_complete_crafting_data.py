@@ -15,490 +15,805 @@ This script loads from the comprehensive JSON reference files.
 
 import sys
 import os
-import json
-
-# Change to backend directory to ensure database is created there
-backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-os.chdir(backend_dir)
-sys.path.insert(0, backend_dir)
+import hashlib
+import io
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, NamedTuple, Optional
+
+import orjson
+
+# Run as a plain file (python scripts/...): change to backend directory to
+# ensure database is created there, and make the app package importable.
+# Not needed under python -m scripts.<name> from backend/ or when imported
+if not __package__:
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(backend_dir)
+    sys.path.insert(0, backend_dir)
 
 from app.models.crafting import (
     BaseItem, Modifier, CurrencyConfig, Essence, EssenceItemEffect,
-    Omen, OmenRule, DesecrationBone
+    Omen, OmenRule, DesecrationBone, SeedVersion
 )
 from app.models.base import get_db
+from sqlalchemy import Enum, Integer, Numeric, String, delete, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 
+SOURCE_DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "source_data"
+)
+
+
 def get_json_path(filename: str) -> str:
     """Get path to JSON file in source_data directory."""
-    return os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        "source_data",
+    return os.path.join(SOURCE_DATA_DIR, filename)
+
+
+SOURCE_FILES = [
+    "generated_item_bases.json",
+    "generated_modifiers.json",
+    "essence_modifiers.json",
+    "desecrated_modifiers.json",
+    "currency_configs.json",
+    "essences.json",
+    "essence_item_effects.json",
+    "omens.json",
+    "desecration_bones.json",
+]
+
+
+# Keys every record must have (the loaders index these directly)
+REQUIRED_KEYS = {
+    "generated_item_bases.json": ("name", "category", "slot"),
+    "generated_modifiers.json": ("name", "mod_type", "tier", "stat_text"),
+    "essence_modifiers.json": ("name", "mod_type", "tier", "stat_text"),
+    "desecrated_modifiers.json": (
+        "name", "mod_type", "tier", "stat_text", "required_ilvl", "weight",
+        "mod_group", "applicable_items", "tags", "is_exclusive"
+    ),
+    "currency_configs.json": ("name", "currency_type", "rarity", "mechanic_class"),
+    "essences.json": ("name", "essence_tier", "essence_type"),
+    "essence_item_effects.json": ("essence_name", "item_types", "modifier_type", "effect_text"),
+    "omens.json": ("name", "effect_description", "affected_currency"),
+    "desecration_bones.json": ("name", "bone_type", "bone_part"),
+}
+
+
+def validate_source_data(filename: str, records: Optional[list]):
+    """Raise ValueError if any record in a parsed source file lacks a required key."""
+    if records is None:
+        return
+
+    required = REQUIRED_KEYS.get(filename, ())
+    for index, record in enumerate(records):
+        missing = [key for key in required if key not in record]
+        if missing:
+            raise ValueError(f"{filename} entry {index} is missing {', '.join(missing)}")
+
+
+def read_json(filename: str) -> Optional[list]:
+    """Parse a JSON file from source_data, or return None if it is missing."""
+    json_path = get_json_path(filename)
+
+    if not os.path.exists(json_path):
+        return None
+
+    with open(json_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def compute_seed_hashes() -> dict:
+    """SHA-256 of each source file that exists, keyed by filename."""
+    seed_hashes = {}
+    for filename in SOURCE_FILES:
+        json_path = get_json_path(filename)
+        if os.path.exists(json_path):
+            with open(json_path, 'rb') as f:
+                seed_hashes[filename] = hashlib.sha256(f.read()).hexdigest()
+    return seed_hashes
+
+
+def ensure_seed_versions_table(db: Session):
+    """Create seed_versions if missing.
+
+    Databases created before seed_versions existed won't have the table yet;
+    it is needed both to read the stored hashes and (with --force too) to
+    store the new ones.
+    """
+    SeedVersion.__table__.create(bind=db.get_bind(), checkfirst=True)
+
+
+def get_stored_seed_hashes(db: Session) -> dict:
+    """Return the per-file hashes recorded by the last successful population."""
+    return dict(db.query(SeedVersion.name, SeedVersion.content_hash))
+
+
+def store_seed_hashes(db: Session, seed_hashes: dict):
+    """Record the hashes of the source files that were just loaded.
+
+    Rows for files that no longer exist (or the single whole-seed hash older
+    versions of this script stored) are removed.
+    """
+    stored = {seed.name: seed for seed in db.query(SeedVersion)}
+    for filename, content_hash in seed_hashes.items():
+        seed = stored.pop(filename, None)
+        if seed:
+            seed.content_hash = content_hash
+        else:
+            db.add(SeedVersion(name=filename, content_hash=content_hash))
+    for seed in stored.values():
+        db.delete(seed)
+    db.flush()
+
+
+# SQLite settings applied for the duration of a seed. The journal stays a
+# rollback journal (not WAL) so the database file is left as it was found.
+SEED_PRAGMAS = {
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "temp_store": "MEMORY",
+    "cache_size": -200000,
+}
+
+
+@contextmanager
+def relaxed_durability(db: Session):
+    """Turn off per-commit fsync while seeding; a lost seed can simply be re-run.
+
+    SQLite gets synchronous=OFF, an in-memory rollback journal and temp store,
+    and a ~200MB page cache, restored on exit. PostgreSQL gets
+    SET LOCAL synchronous_commit=off, which ends with the seed transaction
+    itself, so nothing leaks onto the pooled connection.
+    """
+    dialect = db.get_bind().dialect.name
+    saved_pragmas = {}
+
+    if dialect == "sqlite":
+        for pragma in SEED_PRAGMAS:
+            saved_pragmas[pragma] = db.execute(text(f"PRAGMA {pragma}")).scalar()
+        for pragma, value in SEED_PRAGMAS.items():
+            db.execute(text(f"PRAGMA {pragma}={value}"))
+    elif dialect == "postgresql":
+        db.execute(text("SET LOCAL synchronous_commit = off"))
+
+    try:
+        yield
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        for pragma, value in saved_pragmas.items():
+            db.execute(text(f"PRAGMA {pragma}={value}"))
+
+
+# Tables rebuilt from scratch on every run, children first. Essences, omens,
+# bones and currency configs are upserted by name in their loaders (stale
+# names pruned there, every row when the source file is missing) instead
+CLEARED_TABLES = (
+    EssenceItemEffect.__table__,
+    OmenRule.__table__,
+    Modifier.__table__,
+    BaseItem.__table__,
+)
+
+
+class SeedGroup(NamedTuple):
+    """Source files loaded together, and the tables cleared before they are."""
+    files: tuple
+    cleared_tables: tuple = ()
+
+
+MODIFIER_FILES = ("generated_modifiers.json", "essence_modifiers.json", "desecrated_modifiers.json")
+
+# A group is reloaded when any of its files changed. Base items follow the
+# modifiers too, because TRUNCATE ... CASCADE on modifiers empties base_items
+# (implicit_mod_id) on PostgreSQL
+SEED_GROUPS = {
+    "base_items": SeedGroup(("generated_item_bases.json",) + MODIFIER_FILES, (BaseItem.__table__,)),
+    "modifiers": SeedGroup(MODIFIER_FILES, (Modifier.__table__,)),
+    "currency_configs": SeedGroup(("currency_configs.json",)),
+    "essences": SeedGroup(("essences.json", "essence_item_effects.json"), (EssenceItemEffect.__table__,)),
+    "omens": SeedGroup(("omens.json",), (OmenRule.__table__,)),
+    "desecration_bones": SeedGroup(("desecration_bones.json",)),
+}
+
+
+def changed_seed_groups(seed_hashes: dict, stored_hashes: dict) -> list:
+    """Names of the seed groups with a source file added, removed or edited."""
+    changed_files = {
         filename
-    )
+        for filename in SOURCE_FILES
+        if seed_hashes.get(filename) != stored_hashes.get(filename)
+    }
+    return [
+        name
+        for name, group in SEED_GROUPS.items()
+        if changed_files.intersection(group.files)
+    ]
+
+
+def seed_files_for(groups) -> list:
+    """Source files the given seed groups read, in SOURCE_FILES order."""
+    return [
+        filename
+        for filename in SOURCE_FILES
+        if any(filename in SEED_GROUPS[name].files for name in groups)
+    ]
 
 
-def clear_existing_data(db: Session):
-    """Clear all existing crafting data."""
-    print("Clearing existing crafting data...")
+def cleared_tables_for(groups) -> list:
+    """Tables the given seed groups rebuild, in CLEARED_TABLES (children first) order."""
+    return [
+        table
+        for table in CLEARED_TABLES
+        if any(table in SEED_GROUPS[name].cleared_tables for name in groups)
+    ]
 
-    # Clear in dependency order
-    db.query(EssenceItemEffect).delete()
-    db.query(OmenRule).delete()
 
-    db.query(Essence).delete()
-    db.query(Omen).delete()
-    db.query(DesecrationBone).delete()
-    db.query(CurrencyConfig).delete()
-    db.query(Modifier).delete()
-    db.query(BaseItem).delete()
+def clear_existing_data(db: Session, tables=CLEARED_TABLES):
+    """Clear existing crafting data from tables (all rebuilt tables by default).
+
+    On PostgreSQL this is a single TRUNCATE ... CASCADE, which also empties
+    every table with a foreign key into the cleared ones: base_items (through
+    implicit_mod_id, reloaded along with the modifiers) and pool_modifiers,
+    which this script doesn't reload. SQLite's plain DELETEs leave those
+    tables alone.
+    """
+    if not tables:
+        return
+
+    print("Clearing existing crafting data...")
+
+    if db.get_bind().dialect.name == "postgresql":
+        # One statement, no per-row work; see above for what CASCADE empties.
+        # Pool modifiers' ids would be dangling after the reload anyway
+        table_names = ", ".join(table.name for table in tables)
+        db.execute(text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
+    else:
+        # Plain Core DELETEs: no ORM session synchronization
+        for table in tables:
+            db.execute(delete(table))
 
-    db.commit()
     print("Cleared existing data")
 
 
-def load_base_items(db: Session):
-    """Load base items from JSON file."""
-    json_path = get_json_path("generated_item_bases.json")
+@contextmanager
+def secondary_indexes_dropped(db: Session, tables=CLEARED_TABLES):
+    """Drop the non-unique indexes of tables while they are bulk loaded.
 
-    if not os.path.exists(json_path):
-        print(f"Warning: {json_path} not found - skipping base items")
-        return
+    Each index is rebuilt once on exit instead of being maintained row by
+    row. Unique indexes stay, since deduplication and upserts rely on them.
+    Enter it once the seed transaction has written something: the DDL then
+    runs inside it, so a failed load rolls the drops back with everything
+    else.
+    """
+    indexes = [
+        index
+        for table in tables
+        for index in table.indexes
+        if not index.unique
+    ]
+    connection = db.connection()
 
-    with open(json_path, 'r') as f:
-        items_data = json.load(f)
+    # checkfirst: databases created before an index was added to the models
+    # may not have it
+    for index in indexes:
+        index.drop(bind=connection, checkfirst=True)
 
-    print(f"Loading {len(items_data)} base items...")
+    yield
 
-    added_count = 0
-    seen_names = set()
+    for index in indexes:
+        index.create(bind=connection, checkfirst=True)
 
+
+def _iter_new_base_item_rows(items_data, existing_names: set):
+    """Yield insert mappings for base items whose name isn't taken yet.
+
+    existing_names holds the names already in the table and is extended as
+    rows are yielded, so it also drops duplicates within the file.
+    """
     for item_data in items_data:
         item_name = item_data["name"]
 
-        # Skip if we've already seen this name in this batch
-        if item_name in seen_names:
+        # Skip names already in the database or earlier in this file
+        if item_name in existing_names:
             continue
 
-        seen_names.add(item_name)
+        existing_names.add(item_name)
+
+        yield {
+            "name": item_name,
+            "category": item_data["category"],
+            "slot": item_data["slot"],
+            "attribute_requirements": item_data.get("attribute_requirements", []),
+            "default_ilvl": item_data.get("default_ilvl", 1),
+            "description": item_data.get("description"),
+            "base_stats": item_data.get("base_stats", {}),
+            "subcategory": item_data.get("subcategory"),
+            "required_level": item_data.get("required_level", 0),
+            "required_str": item_data.get("required_str", 0),
+            "required_dex": item_data.get("required_dex", 0),
+            "required_int": item_data.get("required_int", 0)
+        }
+
+
+def load_base_items(db: Session, items_data: Optional[list]):
+    """Load base items parsed from generated_item_bases.json."""
+    if items_data is None:
+        print("Warning: generated_item_bases.json not found - skipping base items")
+        return
 
-        # Check if item already exists in database
-        existing = db.query(BaseItem).filter(BaseItem.name == item_name).first()
-        if existing:
-            continue
+    print(f"Loading {len(items_data)} base items...")
 
-        base_item = BaseItem(
-            name=item_name,
-            category=item_data["category"],
-            slot=item_data["slot"],
-            attribute_requirements=item_data.get("attribute_requirements", []),
-            default_ilvl=item_data.get("default_ilvl", 1),
-            description=item_data.get("description"),
-            base_stats=item_data.get("base_stats", {}),
-            subcategory=item_data.get("subcategory"),
-            required_level=item_data.get("required_level", 0),
-            required_str=item_data.get("required_str", 0),
-            required_dex=item_data.get("required_dex", 0),
-            required_int=item_data.get("required_int", 0)
-        )
-        db.add(base_item)
-        added_count += 1
+    # One name prefetch instead of an existence SELECT per row
+    existing_names = {name for (name,) in db.query(BaseItem.name)}
 
-    db.commit()
+    # One batched Core executemany instead of an ORM object per row
+    added_count = insert_in_batches(db, BaseItem.__table__, _iter_new_base_item_rows(items_data, existing_names))
     print(f"Loaded {added_count} unique base items (from {len(items_data)} entries)")
 
 
-def load_modifiers(db: Session):
-    """Load base modifiers from JSON file."""
-    json_path = get_json_path("generated_modifiers.json")
+def weight_key(weight_conditions: Optional[dict]) -> tuple:
+    """The weightKey list of a modifier's weight_conditions as a tuple (() if none)."""
+    if weight_conditions and "weightKey" in weight_conditions:
+        return tuple(weight_conditions["weightKey"])
+    return ()
 
-    if not os.path.exists(json_path):
-        print(f"Warning: {json_path} not found - skipping base modifiers")
-        return
 
-    with open(json_path, 'r') as f:
-        modifiers_data = json.load(f)
+def modifier_key(mod_data: dict) -> tuple:
+    """Dedup key for a source modifier entry.
 
-    print(f"Loading {len(modifiers_data)} base modifiers...")
+    name, mod_type, tier, mod_group, stat_text AND weightKey, since the same
+    name/tier can have different weight conditions for different item types.
+    """
+    return (
+        mod_data["name"],
+        mod_data["mod_type"],
+        mod_data["tier"],
+        mod_data.get("mod_group"),
+        mod_data["stat_text"],
+        weight_key(mod_data.get("weight_conditions"))
+    )
 
-    added_count = 0
-    seen_keys = set()
 
+def dedupe_modifiers(modifiers_data) -> dict:
+    """Key source modifier entries by modifier_key, keeping the first of each."""
+    deduped = {}
     for mod_data in modifiers_data:
-        # Create unique key from name, mod_type, tier, mod_group, stat_text, AND weightKey
-        # (since same name/tier can have different weight conditions for different item types)
-        weight_key_tuple = tuple(mod_data.get("weight_conditions", {}).get("weightKey", [])) if mod_data.get("weight_conditions") else ()
-        mod_key = (
-            mod_data["name"],
-            mod_data["mod_type"],
-            mod_data["tier"],
-            mod_data.get("mod_group"),
-            mod_data["stat_text"],
-            weight_key_tuple  # Include weightKey to distinguish variants
-        )
+        deduped.setdefault(modifier_key(mod_data), mod_data)
+    return deduped
+
+
+def _modifier_row(mod_data: dict, default_exclusive: bool = False) -> dict:
+    """Insert mapping for a base or essence modifier entry."""
+    return {
+        "name": mod_data["name"],
+        "mod_type": mod_data["mod_type"],
+        "tier": mod_data["tier"],
+        "stat_text": mod_data["stat_text"],
+        "stat_ranges": mod_data.get("stat_ranges", []),
+        "stat_min": mod_data.get("stat_min"),
+        "stat_max": mod_data.get("stat_max"),
+        "required_ilvl": mod_data.get("required_ilvl", 0),
+        "weight": mod_data.get("weight", 1000),
+        "mod_group": mod_data.get("mod_group"),
+        "applicable_items": mod_data.get("applicable_items", []),
+        "tags": mod_data.get("tags", []),
+        "weight_conditions": mod_data.get("weight_conditions"),
+        "is_exclusive": mod_data.get("is_exclusive", default_exclusive)
+    }
+
+
+def merge_modifier_sources(modifiers_data: Optional[list], essence_modifiers: Optional[list]) -> tuple:
+    """Merge base and essence modifier entries into one {key: row} dict.
+
+    essence_modifiers.json takes precedence: an essence entry replaces the
+    base entry with the same key in place (keeping its position, and so its
+    id), and essence mods default to is_exclusive=True. Returns the merged
+    rows and the number of base entries an essence entry replaced.
+    """
+    merged = {
+        mod_key: _modifier_row(mod_data)
+        for mod_key, mod_data in dedupe_modifiers(modifiers_data or []).items()
+    }
 
-        # Skip if we've already seen this combination in this batch
-        if mod_key in seen_keys:
-            continue
+    replaced_count = 0
+    for mod_key, mod_data in dedupe_modifiers(essence_modifiers or []).items():
+        replaced_count += mod_key in merged
+        merged[mod_key] = _modifier_row(mod_data, default_exclusive=True)
 
-        seen_keys.add(mod_key)
-
-        # Check if modifier already exists in database
-        # Compare weight_conditions as JSON string for database lookup
-        existing = db.query(Modifier).filter(
-            Modifier.name == mod_data["name"],
-            Modifier.mod_type == mod_data["mod_type"],
-            Modifier.tier == mod_data["tier"],
-            Modifier.mod_group == mod_data.get("mod_group"),
-            Modifier.stat_text == mod_data["stat_text"]
-        ).all()
-
-        # Further filter by weight_conditions since SQLAlchemy can't easily compare JSON
-        if existing:
-            for exist_mod in existing:
-                exist_weight_key = tuple(exist_mod.weight_conditions.get("weightKey", [])) if exist_mod.weight_conditions else ()
-                if exist_weight_key == weight_key_tuple:
-                    existing = exist_mod
-                    break
-            else:
-                existing = None
-        else:
-            existing = None
+    return merged, replaced_count
 
-        if existing:
-            continue
 
-        modifier = Modifier(
-            name=mod_data["name"],
-            mod_type=mod_data["mod_type"],
-            tier=mod_data["tier"],
-            stat_text=mod_data["stat_text"],
-            stat_ranges=mod_data.get("stat_ranges", []),
-            stat_min=mod_data.get("stat_min"),
-            stat_max=mod_data.get("stat_max"),
-            required_ilvl=mod_data.get("required_ilvl", 0),
-            weight=mod_data.get("weight", 1000),
-            mod_group=mod_data.get("mod_group"),
-            applicable_items=mod_data.get("applicable_items", []),
-            tags=mod_data.get("tags", []),
-            weight_conditions=mod_data.get("weight_conditions"),
-            is_exclusive=mod_data.get("is_exclusive", False)
-        )
-        db.add(modifier)
-        added_count += 1
+def load_modifiers(db: Session, modifiers_data: Optional[list], essence_modifiers: Optional[list]):
+    """Load base and essence modifiers parsed from generated_modifiers.json and essence_modifiers.json.
 
-    db.commit()
-    print(f"Loaded {added_count} unique base modifiers (from {len(modifiers_data)} entries)")
+    Both files are merged in Python first, so the modifiers table (emptied by
+    clear_existing_data) only ever sees one batched insert and no UPDATEs.
+    """
+    if modifiers_data is None:
+        print("Warning: generated_modifiers.json not found - skipping base modifiers")
+    else:
+        print(f"Loading {len(modifiers_data)} base modifiers...")
 
+    if essence_modifiers is None:
+        print("Warning: essence_modifiers.json not found - skipping essence modifiers")
+    else:
+        print(f"Loading {len(essence_modifiers)} essence modifiers...")
 
-def load_essence_modifiers(db: Session):
-    """Load essence-specific modifiers from JSON file.
+    merged, replaced_count = merge_modifier_sources(modifiers_data, essence_modifiers)
+    added_count = insert_in_batches(db, Modifier.__table__, merged.values())
+    print(f"Loaded {added_count} unique base and essence modifiers ({replaced_count} base modifiers overridden by essence data)")
 
-    Updates existing modifiers if they already exist (from generated_modifiers.json),
-    ensuring essence_modifiers.json takes precedence.
-    """
-    json_path = get_json_path("essence_modifiers.json")
 
-    if not os.path.exists(json_path):
-        print(f"Warning: {json_path} not found - skipping essence modifiers")
+def load_desecrated_modifiers(db: Session, desecrated_modifiers: Optional[list]):
+    """Load desecrated modifiers parsed from desecrated_modifiers.json."""
+    if desecrated_modifiers is None:
+        print("Warning: desecrated_modifiers.json not found - skipping desecrated modifiers")
         return
 
-    with open(json_path, 'r') as f:
-        essence_modifiers = json.load(f)
-
-    print(f"Loading {len(essence_modifiers)} essence modifiers...")
-
-    added_count = 0
-    updated_count = 0
-    seen_keys = set()
-
-    for mod_data in essence_modifiers:
-        # Create unique key from name, mod_type, tier, mod_group, stat_text, AND weightKey
-        weight_key_tuple = tuple(mod_data.get("weight_conditions", {}).get("weightKey", [])) if mod_data.get("weight_conditions") else ()
-        mod_key = (
-            mod_data["name"],
-            mod_data["mod_type"],
-            mod_data["tier"],
-            mod_data.get("mod_group"),
-            mod_data["stat_text"],
-            weight_key_tuple  # Include weightKey to distinguish variants
-        )
+    print(f"Loading {len(desecrated_modifiers)} desecrated modifiers...")
 
-        # Skip if we've already seen this combination in this batch
-        if mod_key in seen_keys:
-            continue
+    modifier_rows = (
+        {
+            "name": mod_data["name"],
+            "mod_type": mod_data["mod_type"],
+            "tier": mod_data["tier"],
+            "stat_text": mod_data["stat_text"],
+            "stat_ranges": mod_data.get("stat_ranges", []),
+            "stat_min": mod_data.get("stat_min"),
+            "stat_max": mod_data.get("stat_max"),
+            "required_ilvl": mod_data["required_ilvl"],
+            "weight": mod_data["weight"],
+            "mod_group": mod_data["mod_group"],
+            "applicable_items": mod_data["applicable_items"],
+            "tags": mod_data["tags"],
+            "weight_conditions": mod_data.get("weight_conditions"),
+            "is_exclusive": mod_data["is_exclusive"]
+        }
+        for mod_data in desecrated_modifiers
+    )
+    insert_in_batches(db, Modifier.__table__, modifier_rows)
+    print(f"Loaded {len(desecrated_modifiers)} desecrated modifiers")
 
-        seen_keys.add(mod_key)
-
-        # Check if modifier already exists in database
-        existing = db.query(Modifier).filter(
-            Modifier.name == mod_data["name"],
-            Modifier.mod_type == mod_data["mod_type"],
-            Modifier.tier == mod_data["tier"],
-            Modifier.mod_group == mod_data.get("mod_group"),
-            Modifier.stat_text == mod_data["stat_text"]
-        ).all()
-
-        # Further filter by weight_conditions
-        if existing:
-            for exist_mod in existing:
-                exist_weight_key = tuple(exist_mod.weight_conditions.get("weightKey", [])) if exist_mod.weight_conditions else ()
-                if exist_weight_key == weight_key_tuple:
-                    existing = exist_mod
-                    break
-            else:
-                existing = None
-        else:
-            existing = None
-
-        if existing:
-            # Update existing modifier with essence data
-            existing.stat_ranges = mod_data.get("stat_ranges", [])
-            existing.stat_min = mod_data.get("stat_min")
-            existing.stat_max = mod_data.get("stat_max")
-            existing.required_ilvl = mod_data.get("required_ilvl", 0)
-            existing.weight = mod_data.get("weight", 1000)
-            existing.applicable_items = mod_data.get("applicable_items", [])
-            existing.tags = mod_data.get("tags", [])
-            existing.weight_conditions = mod_data.get("weight_conditions")
-            existing.is_exclusive = mod_data.get("is_exclusive", True)
-            updated_count += 1
-        else:
-            # Add new modifier
-            modifier = Modifier(
-                name=mod_data["name"],
-                mod_type=mod_data["mod_type"],
-                tier=mod_data["tier"],
-                stat_text=mod_data["stat_text"],
-                stat_ranges=mod_data.get("stat_ranges", []),
-                stat_min=mod_data.get("stat_min"),
-                stat_max=mod_data.get("stat_max"),
-                required_ilvl=mod_data.get("required_ilvl", 0),
-                weight=mod_data.get("weight", 1000),
-                mod_group=mod_data.get("mod_group"),
-                applicable_items=mod_data.get("applicable_items", []),
-                tags=mod_data.get("tags", []),
-                weight_conditions=mod_data.get("weight_conditions"),
-                is_exclusive=mod_data.get("is_exclusive", True)  # Default to True for essence mods
-            )
-            db.add(modifier)
-            added_count += 1
+    # Summary by item type, written in one call rather than a print per line
+    item_counts = Counter(
+        item
+        for mod in desecrated_modifiers
+        for item in mod["applicable_items"]
+    )
+    summary_lines = (f"  {item}: {count} modifiers" for item, count in sorted(item_counts.items()))
+    print("Desecrated modifiers per item type:", *summary_lines, sep="\n")
 
-    db.commit()
-    print(f"Loaded {added_count} new essence modifiers, updated {updated_count} existing modifiers (from {len(essence_modifiers)} entries)")
 
+class CurrencyRow(NamedTuple):
+    """One currency_configs row, in column order."""
+    name: str
+    currency_type: str
+    tier: Optional[str]
+    rarity: str
+    stack_size: int
+    mechanic_class: str
+    config_data: dict
 
-def load_desecrated_modifiers(db: Session):
-    """Load desecrated modifiers from JSON file."""
-    json_path = get_json_path("desecrated_modifiers.json")
 
-    if not os.path.exists(json_path):
-        print(f"Warning: {json_path} not found - skipping desecrated modifiers")
-        return
+INSERT_BATCH_SIZE = 500
+# COPY rows are cheap to stream, so batches can be much larger
+COPY_BATCH_SIZE = 10000
 
-    with open(json_path, 'r') as f:
-        desecrated_modifiers = json.load(f)
 
-    print(f"Loading {len(desecrated_modifiers)} desecrated modifiers...")
+def insert_in_batches(db: Session, table, rows: Iterable[dict], batch_size: int = INSERT_BATCH_SIZE) -> int:
+    """Execute a Core INSERT for rows, one executemany per batch_size rows.
 
-    for mod_data in desecrated_modifiers:
-        modifier = Modifier(
-            name=mod_data["name"],
-            mod_type=mod_data["mod_type"],
-            tier=mod_data["tier"],
-            stat_text=mod_data["stat_text"],
-            stat_ranges=mod_data.get("stat_ranges", []),
-            stat_min=mod_data.get("stat_min"),
-            stat_max=mod_data.get("stat_max"),
-            required_ilvl=mod_data["required_ilvl"],
-            weight=mod_data["weight"],
-            mod_group=mod_data["mod_group"],
-            applicable_items=mod_data["applicable_items"],
-            tags=mod_data["tags"],
-            weight_conditions=mod_data.get("weight_conditions"),
-            is_exclusive=mod_data["is_exclusive"]
-        )
-        db.add(modifier)
+    rows may be a lazy iterator; at most one batch is materialized at a time.
+    Returns the number of rows inserted.
+    """
+    rows = iter(rows)
+    total = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return total
+        db.execute(table.insert(), batch)
+        total += len(batch)
+
+
+def _copy_text_value(value) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return r"\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
 
-    db.commit()
-    print(f"Loaded {len(desecrated_modifiers)} desecrated modifiers")
 
-    # Summary by item type
-    item_counts = {}
-    for mod in desecrated_modifiers:
-        for item in mod["applicable_items"]:
-            item_counts[item] = item_counts.get(item, 0) + 1
+def _is_copy_safe(table) -> bool:
+    """Whether every column of table renders correctly through _copy_text_value.
 
-    print("Desecrated modifiers per item type:")
-    for item, count in sorted(item_counts.items()):
-        print(f"  {item}: {count} modifiers")
+    COPY skips SQLAlchemy's bind processing, so only plain integer, numeric
+    and string columns qualify; JSON, Boolean and Enum columns need the
+    type's own conversion.
+    """
+    return all(
+        isinstance(column.type, (Integer, Numeric, String)) and not isinstance(column.type, Enum)
+        for column in table.columns
+    )
 
 
-def load_currency_configs(db: Session):
-    """Load currency configurations from JSON file."""
-    json_path = get_json_path("currency_configs.json")
+def copy_rows(db: Session, table, rows: Iterable[dict], batch_size: int = COPY_BATCH_SIZE) -> int:
+    """Bulk-load rows of scalar columns with COPY FROM STDIN on PostgreSQL.
 
-    if not os.path.exists(json_path):
-        print(f"Warning: {json_path} not found - skipping currency configs")
-        return
+    Runs on the session's connection, so it is part of the seed transaction.
+    rows may be a lazy iterator; one COPY is issued per batch_size rows, so
+    at most one batch is buffered at a time. Other databases, non-psycopg2
+    drivers and tables with non-scalar columns (see _is_copy_safe) fall back
+    to insert_in_batches.
+    Returns the number of rows loaded.
+    """
+    bind = db.get_bind()
+    if (
+        bind.dialect.name != "postgresql"
+        or bind.dialect.driver != "psycopg2"
+        or not _is_copy_safe(table)
+    ):
+        return insert_in_batches(db, table, rows)
+
+    rows = iter(rows)
+    total = 0
+    cursor = db.connection().connection.cursor()
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return total
 
-    with open(json_path, 'r') as f:
-        currency_data = json.load(f)
+            columns = list(batch[0])
+            buffer = io.StringIO()
+            for row in batch:
+                buffer.write("\t".join(_copy_text_value(row[column]) for column in columns))
+                buffer.write("\n")
+            buffer.seek(0)
 
-    print(f"Loading {len(currency_data)} currency configurations...")
+            cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN", buffer)
+            total += len(batch)
+    finally:
+        cursor.close()
+
+
+def upsert_insert(db: Session, model):
+    """INSERT construct with ON CONFLICT support for the session's dialect."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
 
+
+def upsert_by_name(db: Session, model, rows: Iterable[dict], batch_size: int = INSERT_BATCH_SIZE) -> dict:
+    """Upsert name-keyed rows and delete rows whose name is no longer present.
+
+    Each batch is one INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING,
+    so existing rows keep their ids across re-runs. Returns {name: id}.
+    """
+    stmt = upsert_insert(db, model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[model.name],
+        set_={
+            column.name: stmt.excluded[column.name]
+            for column in model.__table__.columns
+            if column.name not in ("id", "name")
+        }
+    ).returning(model.id, model.name)
+
+    ids = {}
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        ids.update((name, row_id) for row_id, name in db.execute(stmt, batch))
+
+    db.execute(delete(model).where(model.name.not_in(ids)))
+    return ids
+
+
+def _iter_currency_rows(currency_data):
+    """Yield a CurrencyRow per currency configuration."""
     for config_data in currency_data:
-        currency_config = CurrencyConfig(
-            name=config_data["name"],
-            currency_type=config_data["currency_type"],
-            tier=config_data.get("tier"),
-            rarity=config_data["rarity"],
-            stack_size=config_data.get("stack_size", 20),
-            mechanic_class=config_data["mechanic_class"],
-            config_data=config_data.get("config_data", {})
+        yield CurrencyRow(
+            config_data["name"],
+            config_data["currency_type"],
+            config_data.get("tier"),
+            config_data["rarity"],
+            config_data.get("stack_size", 20),
+            config_data["mechanic_class"],
+            config_data.get("config_data", {})
         )
-        db.add(currency_config)
 
-    db.commit()
-    print(f"Loaded {len(currency_data)} currency configurations")
 
+def load_currency_configs(db: Session, currency_data: Optional[list]):
+    """Load currency configurations parsed from currency_configs.json."""
+    if currency_data is None:
+        print("Warning: currency_configs.json not found - removing existing currency configs")
+        db.execute(delete(CurrencyConfig))
+        return
+
+    print(f"Loading {len(currency_data)} currency configurations...")
 
-def load_essences(db: Session):
-    """Load essences and their effects from JSON files."""
-    # Load essences
-    essences_path = get_json_path("essences.json")
-    effects_path = get_json_path("essence_item_effects.json")
+    upsert_by_name(db, CurrencyConfig, (row._asdict() for row in _iter_currency_rows(currency_data)))
 
-    if not os.path.exists(essences_path):
-        print(f"Warning: {essences_path} not found - skipping essences")
-        return
+    db.flush()
+    print(f"Loaded {len(currency_data)} currency configurations")
 
-    with open(essences_path, 'r') as f:
-        essences_data = json.load(f)
 
-    print(f"Loading {len(essences_data)} essences...")
+# Lesser/Normal/Greater essences upgrade Magic -> Rare; Perfect/Corrupted
+# ones remove a modifier and augment a Rare
+ESSENCE_MECHANIC_BY_TIER = {
+    "lesser": "magic_to_rare",
+    "normal": "magic_to_rare",
+    "greater": "magic_to_rare",
+    "perfect": "remove_add_rare",
+    "corrupted": "remove_add_rare",
+}
 
+
+def _iter_essence_rows(essences_data):
+    """Yield Essence insert mappings one row at a time."""
     for essence_data in essences_data:
-        essence = Essence(
-            name=essence_data["name"],
-            essence_tier=essence_data["essence_tier"],
-            essence_type=essence_data["essence_type"],
-            mechanic=essence_data["mechanic"],
-            stack_size=essence_data.get("stack_size", 10)
-        )
-        db.add(essence)
+        tier = essence_data["essence_tier"]
+        yield {
+            "name": essence_data["name"],
+            "essence_tier": tier,
+            "essence_type": essence_data["essence_type"],
+            # The mechanic follows from the tier; an explicit value still wins
+            "mechanic": essence_data.get("mechanic") or ESSENCE_MECHANIC_BY_TIER[tier],
+            "stack_size": essence_data.get("stack_size", 10)
+        }
+
+
+class EssenceEffectRow(NamedTuple):
+    """One essence_item_effects row, in column order."""
+    essence_id: int
+    item_type: str
+    modifier_type: str
+    effect_text: str
+    value_min: Optional[float]
+    value_max: Optional[float]
+
+
+def load_essences(db: Session, essences_data: Optional[list], effects_data: Optional[list]):
+    """Load essences and their effects parsed from essences.json and essence_item_effects.json."""
+    if essences_data is None:
+        print("Warning: essences.json not found - removing existing essences")
+        db.execute(delete(Essence))
+        return
+
+    print(f"Loading {len(essences_data)} essences...")
 
-    db.commit()
+    # The upsert keeps existing essence ids stable on re-runs and gives every
+    # id without a flush or a per-effect lookup query. Essences dropped from
+    # the source are deleted (their effects were already cleared)
+    essence_ids = upsert_by_name(db, Essence, _iter_essence_rows(essences_data))
 
     # Load essence effects if available
-    if os.path.exists(effects_path):
-        with open(effects_path, 'r') as f:
-            effects_data = json.load(f)
-
-        print(f"Loading {len(effects_data)} essence item effects...")
-
-        for effect_data in effects_data:
-            # Find the essence by name
-            essence = db.query(Essence).filter(Essence.name == effect_data["essence_name"]).first()
-            if essence:
-                effect = EssenceItemEffect(
-                    essence_id=essence.id,
-                    item_type=effect_data["item_type"],
-                    modifier_type=effect_data["modifier_type"],
-                    effect_text=effect_data["effect_text"],
-                    value_min=effect_data.get("value_min"),
-                    value_max=effect_data.get("value_max")
-                )
-                db.add(effect)
-
-        db.commit()
-        print(f"Loaded {len(effects_data)} essence item effects")
+    if effects_data is not None:
+        print(f"Loading {len(effects_data)} essence item effect groups...")
+
+        # Each source entry lists every item type sharing the same effect;
+        # expand it into one row per item type
+        effect_rows = (
+            EssenceEffectRow(
+                essence_ids[effect_data["essence_name"]],
+                item_type,
+                effect_data["modifier_type"],
+                effect_data["effect_text"],
+                effect_data.get("value_min"),
+                effect_data.get("value_max")
+            )
+            for effect_data in effects_data
+            if effect_data["essence_name"] in essence_ids
+            for item_type in effect_data["item_types"]
+        )
+        # COPY on PostgreSQL, plain Core executemany elsewhere: no ORM
+        # bulk-insert bookkeeping per row, the rows go straight to the DBAPI
+        effect_count = copy_rows(
+            db, EssenceItemEffect.__table__, (row._asdict() for row in effect_rows)
+        )
 
-    print(f"Completed loading essences and effects")
+        print(f"Loaded {effect_count} essence item effects")
 
+    db.flush()
+    print(f"Completed loading essences and effects")
 
-def load_omens(db: Session):
-    """Load omens from JSON file."""
-    json_path = get_json_path("omens.json")
 
-    if not os.path.exists(json_path):
-        print(f"Warning: {json_path} not found - skipping omens")
+def load_omens(db: Session, omens_data: Optional[list]):
+    """Load omens parsed from omens.json."""
+    if omens_data is None:
+        print("Warning: omens.json not found - removing existing omens")
+        db.execute(delete(Omen))
         return
 
-    with open(json_path, 'r') as f:
-        omens_data = json.load(f)
-
     print(f"Loading {len(omens_data)} omens...")
 
-    for omen_data in omens_data:
-        omen = Omen(
-            name=omen_data["name"],
-            effect_description=omen_data["effect_description"],
-            affected_currency=omen_data["affected_currency"],
-            effect_type=omen_data.get("effect_type", "standard"),  # Default to "standard" if not specified
-            stack_size=omen_data.get("stack_size", 10)
+    # Upserted parents come back with their ids so rules can be keyed by omen
+    # id without flushing or re-querying each omen
+    omen_ids = upsert_by_name(
+        db,
+        Omen,
+        (
+            {
+                "name": omen_data["name"],
+                "effect_description": omen_data["effect_description"],
+                "affected_currency": omen_data["affected_currency"],
+                "effect_type": omen_data.get("effect_type", "standard"),  # Default to "standard" if not specified
+                "stack_size": omen_data.get("stack_size", 10)
+            }
+            for omen_data in omens_data
         )
-        db.add(omen)
-
-    db.commit()
+    )
 
     # Load omen rules if they exist in the data
-    rules_count = 0
-    for omen_data in omens_data:
-        if "rules" in omen_data:
-            omen = db.query(Omen).filter(Omen.name == omen_data["name"]).first()
-            if omen:
-                for rule_data in omen_data["rules"]:
-                    rule = OmenRule(
-                        omen_id=omen.id,
-                        rule_type=rule_data["rule_type"],
-                        rule_value=rule_data.get("rule_value"),
-                        priority=rule_data.get("priority", 0)
-                    )
-                    db.add(rule)
-                    rules_count += 1
+    rule_rows = (
+        {
+            "omen_id": omen_ids[omen_data["name"]],
+            "rule_type": rule_data["rule_type"],
+            "rule_value": rule_data.get("rule_value"),
+            "priority": rule_data.get("priority", 0)
+        }
+        for omen_data in omens_data
+        for rule_data in omen_data.get("rules", ())
+    )
+    rules_count = copy_rows(db, OmenRule.__table__, rule_rows)
 
+    db.flush()
     if rules_count > 0:
-        db.commit()
         print(f"Loaded {rules_count} omen rules")
 
     print(f"Completed loading {len(omens_data)} omens")
 
 
-def load_desecration_bones(db: Session):
-    """Load desecration bones from JSON file."""
-    json_path = get_json_path("desecration_bones.json")
-
-    if not os.path.exists(json_path):
-        print(f"Warning: {json_path} not found - skipping desecration bones")
+def load_desecration_bones(db: Session, bones_data: Optional[list]):
+    """Load desecration bones parsed from desecration_bones.json."""
+    if bones_data is None:
+        print("Warning: desecration_bones.json not found - removing existing desecration bones")
+        db.execute(delete(DesecrationBone))
         return
 
-    with open(json_path, 'r') as f:
-        bones_data = json.load(f)
-
     print(f"Loading {len(bones_data)} desecration bones...")
 
-    for bone_data in bones_data:
-        bone = DesecrationBone(
-            name=bone_data["name"],
-            bone_type=bone_data["bone_type"],
-            bone_part=bone_data["bone_part"],
-            mechanic=bone_data.get("mechanic", "add_desecrated_mod"),  # Default mechanic
-            stack_size=bone_data.get("stack_size", 20),
-            applicable_items=bone_data.get("applicable_items", []),
-            min_modifier_level=bone_data.get("min_modifier_level"),
-            max_item_level=bone_data.get("max_item_level"),
-            function_description=bone_data.get("function_description")
-        )
-        db.add(bone)
+    bone_rows = (
+        {
+            "name": bone_data["name"],
+            "bone_type": bone_data["bone_type"],
+            "bone_part": bone_data["bone_part"],
+            "mechanic": bone_data.get("mechanic", "add_desecrated_mod"),  # Default mechanic
+            "stack_size": bone_data.get("stack_size", 20),
+            "applicable_items": bone_data.get("applicable_items", []),
+            "min_modifier_level": bone_data.get("min_modifier_level"),
+            "max_item_level": bone_data.get("max_item_level"),
+            "function_description": bone_data.get("function_description")
+        }
+        for bone_data in bones_data
+    )
+    upsert_by_name(db, DesecrationBone, bone_rows)
 
-    db.commit()
+    db.flush()
     print(f"Loaded {len(bones_data)} desecration bones")
 
 
-def main():
-    """Main function to populate ALL crafting data from JSON files."""
+def main(force: bool = False):
+    """Main function to populate ALL crafting data from JSON files.
+
+    Only the seed groups whose source files changed since the previous run
+    are cleared and reloaded; everything is when force is set.
+    """
     print(f"Working directory: {os.getcwd()}")
     print("Starting COMPLETE crafting data population from JSON files...")
     print("Loading all data from backend/source_data/")
@@ -506,18 +821,63 @@ def main():
     try:
         db = next(get_db())
 
-        # Clear existing data
-        clear_existing_data(db)
+        ensure_seed_versions_table(db)
+        seed_hashes = compute_seed_hashes()
+        stored_hashes = {} if force else get_stored_seed_hashes(db)
+        groups = changed_seed_groups(seed_hashes, stored_hashes)
+        if not groups:
+            print("Source data unchanged since last population - skipping (use --force to reload)")
+            return
+        print(f"Reloading: {', '.join(groups)}")
+
+        needed_files = seed_files_for(groups)
+        cleared_tables = cleared_tables_for(groups)
+
+        with relaxed_durability(db), ThreadPoolExecutor(max_workers=4) as pool:
+            # Parse the needed source files in parallel; the session itself
+            # stays on this thread
+            sources = {filename: pool.submit(read_json, filename) for filename in needed_files}
+
+            # Fail fast on malformed source data before any existing rows are
+            # touched (nothing has been written when this raises)
+            for filename, future in sources.items():
+                validate_source_data(filename, future.result())
+
+            # Clear existing data
+            clear_existing_data(db, cleared_tables)
+
+            # After the clear, so the index drops join its open transaction
+            # (pysqlite doesn't begin one for DDL on its own). Every loader
+            # runs inside, so each cleared table is filled without its indexes
+            with secondary_indexes_dropped(db, cleared_tables):
+                # Load the changed data from JSON files
+                if "base_items" in groups:
+                    load_base_items(db, sources["generated_item_bases.json"].result())
+                if "modifiers" in groups:
+                    load_modifiers(
+                        db,
+                        sources["generated_modifiers.json"].result(),
+                        sources["essence_modifiers.json"].result()
+                    )
+                    load_desecrated_modifiers(db, sources["desecrated_modifiers.json"].result())
+                if "currency_configs" in groups:
+                    load_currency_configs(db, sources["currency_configs.json"].result())
+                if "essences" in groups:
+                    load_essences(
+                        db,
+                        sources["essences.json"].result(),
+                        sources["essence_item_effects.json"].result()
+                    )
+                if "omens" in groups:
+                    load_omens(db, sources["omens.json"].result())
+                if "desecration_bones" in groups:
+                    load_desecration_bones(db, sources["desecration_bones.json"].result())
+
+            store_seed_hashes(db, seed_hashes)
 
-        # Load all data from JSON files
-        load_base_items(db)
-        load_modifiers(db)
-        load_essence_modifiers(db)
-        load_desecrated_modifiers(db)
-        load_currency_configs(db)
-        load_essences(db)
-        load_omens(db)
-        load_desecration_bones(db)
+            # The loaders only flush: clearing, reloading and the new seed hashes
+            # land in a single commit, and any failure rolls all of it back
+            db.commit()
 
         # Get final counts
         base_item_count = db.query(BaseItem).count()
@@ -545,4 +905,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force="--force" in sys.argv[1:])
\ No newline at end of file
@@ -14,10 +14,16 @@ Implements the architecture where:
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Run as a plain file (python scripts/...): change to backend directory to
+# ensure database is created there, and make the app package importable
+if not __package__:
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(backend_dir)
+    sys.path.insert(0, backend_dir)
 
 from scripts.create_tables import create_all_tables
-from scripts.populate_comprehensive_crafting_data import main as populate_data
+from scripts.populate_complete_crafting_data import main as populate_data
 from app.services.crafting.config_service import crafting_config_service
 from app.services.crafting.unified_factory import unified_crafting_factory
 
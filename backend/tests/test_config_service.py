@@ -0,0 +1,71 @@
+"""
+Unit tests for the crafting configuration service.
+
+Configs are filled in directly, so these tests don't need a populated database.
+"""
+
+import pytest
+from app.schemas.crafting import EssenceInfo
+from app.services.crafting.config_service import CraftingConfigService
+
+
+ESSENCE_TIERS = ["lesser", "normal", "greater", "perfect", "corrupted"]
+
+
+@pytest.fixture
+def create_essence():
+    """Factory fixture to create test essences."""
+    def _create_essence(essence_id: int, essence_tier: str, essence_type: str = "body"):
+        return EssenceInfo(
+            id=essence_id,
+            name=f"{essence_tier.title()} Essence {essence_id}",
+            essence_tier=essence_tier,
+            essence_type=essence_type,
+            mechanic="magic_to_rare",
+        )
+    return _create_essence
+
+
+@pytest.fixture
+def config_service(create_essence):
+    """A config service holding essences of every tier, marked as loaded."""
+    service = CraftingConfigService()
+    for essence_id in range(1, 13):
+        essence = create_essence(essence_id, ESSENCE_TIERS[essence_id % len(ESSENCE_TIERS)])
+        service._essence_configs[essence.name] = essence
+    service._build_essence_tier_index()
+    service._loaded = True
+    return service
+
+
+class TestEssenceTierIndex:
+    """Test the tier index behind get_essences_by_tier."""
+
+    @pytest.mark.parametrize("tier", ESSENCE_TIERS)
+    def test_matches_linear_filter(self, config_service, tier):
+        """Each tier bucket holds exactly the essences a linear filter finds, in load order."""
+        expected = [
+            essence for essence in config_service._essence_configs.values()
+            if essence.essence_tier == tier
+        ]
+
+        assert expected
+        assert config_service.get_essences_by_tier(tier) == expected
+
+    def test_unknown_tier_is_empty(self, config_service):
+        """Tiers without essences return an empty list."""
+        assert config_service.get_essences_by_tier("mythic") == []
+
+    def test_returned_list_is_a_copy(self, config_service):
+        """Mutating a result doesn't change the index."""
+        config_service.get_essences_by_tier("greater").clear()
+
+        assert config_service.get_essences_by_tier("greater")
+
+    def test_rebuilt_with_essence_configs(self, config_service, create_essence):
+        """Rebuilding the index picks up newly loaded essences."""
+        essence = create_essence(99, "corrupted")
+        config_service._essence_configs[essence.name] = essence
+        config_service._build_essence_tier_index()
+
+        assert essence in config_service.get_essences_by_tier("corrupted")
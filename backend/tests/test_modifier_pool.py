@@ -521,6 +521,32 @@ class TestModifierPoolQueries:
         assert "Cold Resistance" in names
 
 
+# ============================================================================
+# ELEMENTAL EXCLUSIONS
+# ============================================================================
+
+class TestElementalExclusions:
+    """Test implicit-skill based spell mod exclusions."""
+
+    def test_staff_excludes_other_elements(self, create_test_item):
+        """A Firebolt staff should exclude every non-fire spell mod tag."""
+        pool = ModifierPool([])
+        item = create_test_item(base_name="Ashen Staff", base_category="staff")
+
+        exclusions = pool._get_item_elemental_exclusions(item)
+
+        assert "no_fire_spell_mods" not in exclusions
+        assert "no_cold_spell_mods" in exclusions
+        assert "no_lightning_spell_mods" in exclusions
+
+    def test_base_without_implicit_has_no_exclusions(self, create_test_item):
+        """Bases without an implicit skill (or unknown bases) exclude nothing."""
+        pool = ModifierPool([])
+
+        assert pool._get_item_elemental_exclusions(create_test_item()) == []
+        assert pool._get_item_elemental_exclusions(create_test_item(base_name="Not A Base")) == []
+
+
 # ============================================================================
 # EDGE CASES AND ERROR CONDITIONS
 # ============================================================================
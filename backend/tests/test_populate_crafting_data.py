@@ -0,0 +1,426 @@
+"""
+Tests for the crafting data population script (scripts/populate_complete_crafting_data.py).
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.base import Base
+from app.models.crafting import BaseItem, Essence, EssenceItemEffect, Modifier, Omen, OmenRule, SeedVersion
+from scripts import populate_complete_crafting_data as populate
+
+
+@pytest.fixture
+def seed_engine(tmp_path, monkeypatch):
+    """Point the populate script at an empty SQLite database file."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_test_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(populate, "get_db", get_test_db)
+    yield engine
+    engine.dispose()
+
+
+def make_mod(name: str, tier: int = 1, weight_key=None, **fields) -> dict:
+    """A source modifier entry with the keys the loaders require."""
+    mod = {"name": name, "mod_type": "prefix", "tier": tier, "stat_text": f"+# to {name}"}
+    if weight_key is not None:
+        mod["weight_conditions"] = {"weightKey": weight_key}
+    mod.update(fields)
+    return mod
+
+
+class TestChangedSeedGroups:
+    """Test which seed groups a changed source file triggers."""
+
+    def test_unchanged_files_trigger_nothing(self):
+        hashes = {filename: "hash" for filename in populate.SOURCE_FILES}
+
+        assert populate.changed_seed_groups(hashes, dict(hashes)) == []
+
+    def test_empty_store_triggers_every_group(self):
+        """A first run (or --force, which passes no stored hashes) reloads everything."""
+        hashes = {filename: "hash" for filename in populate.SOURCE_FILES}
+
+        assert populate.changed_seed_groups(hashes, {}) == list(populate.SEED_GROUPS)
+
+    def test_single_file_triggers_its_group(self):
+        stored = {filename: "hash" for filename in populate.SOURCE_FILES}
+        hashes = dict(stored, **{"omens.json": "new"})
+
+        assert populate.changed_seed_groups(hashes, stored) == ["omens"]
+
+    @pytest.mark.parametrize("filename", populate.MODIFIER_FILES)
+    def test_modifier_files_also_reload_base_items(self, filename):
+        """TRUNCATE ... CASCADE on modifiers empties base_items, so they reload together."""
+        stored = {name: "hash" for name in populate.SOURCE_FILES}
+        hashes = dict(stored, **{filename: "new"})
+
+        assert populate.changed_seed_groups(hashes, stored) == ["base_items", "modifiers"]
+
+    def test_item_bases_alone_leave_modifiers(self):
+        stored = {filename: "hash" for filename in populate.SOURCE_FILES}
+        hashes = dict(stored, **{"generated_item_bases.json": "new"})
+
+        assert populate.changed_seed_groups(hashes, stored) == ["base_items"]
+
+    def test_removed_file_triggers_its_group(self):
+        stored = {filename: "hash" for filename in populate.SOURCE_FILES}
+        hashes = {filename: "hash" for filename in populate.SOURCE_FILES if filename != "desecration_bones.json"}
+
+        assert populate.changed_seed_groups(hashes, stored) == ["desecration_bones"]
+
+    def test_every_source_file_belongs_to_a_group(self):
+        grouped = {filename for group in populate.SEED_GROUPS.values() for filename in group.files}
+
+        assert grouped == set(populate.SOURCE_FILES)
+
+
+class TestSeedGroupSelection:
+    """Test the files read and tables cleared for a set of seed groups."""
+
+    def test_cleared_tables_children_first(self):
+        tables = populate.cleared_tables_for(["base_items", "modifiers", "essences", "omens"])
+
+        assert tables == [
+            EssenceItemEffect.__table__, OmenRule.__table__, Modifier.__table__, BaseItem.__table__
+        ]
+
+    def test_upserted_groups_clear_nothing(self):
+        assert populate.cleared_tables_for(["currency_configs", "desecration_bones"]) == []
+
+    def test_seed_files_for_group(self):
+        assert populate.seed_files_for(["essences"]) == ["essences.json", "essence_item_effects.json"]
+
+    def test_seed_files_are_deduplicated(self):
+        """Modifier files shared by base_items and modifiers are read once."""
+        files = populate.seed_files_for(["base_items", "modifiers"])
+
+        assert files == ["generated_item_bases.json", *populate.MODIFIER_FILES]
+
+
+class TestMergeModifierSources:
+    """Test merging base and essence modifier entries before the insert."""
+
+    def test_duplicates_keep_first_entry(self):
+        merged, replaced = populate.merge_modifier_sources(
+            [make_mod("Life", weight=10), make_mod("Life", weight=20)], []
+        )
+
+        assert [row["weight"] for row in merged.values()] == [10]
+        assert replaced == 0
+
+    def test_weight_key_distinguishes_entries(self):
+        merged, _ = populate.merge_modifier_sources(
+            [make_mod("Life", weight_key=["ring"]), make_mod("Life", weight_key=["amulet"])], []
+        )
+
+        assert len(merged) == 2
+
+    def test_essence_entry_replaces_base_in_place(self):
+        """The overridden row keeps its position (and so its id) and defaults to exclusive."""
+        merged, replaced = populate.merge_modifier_sources(
+            [make_mod("Life"), make_mod("Mana")],
+            [make_mod("Life", weight=5)],
+        )
+
+        rows = list(merged.values())
+        assert [row["name"] for row in rows] == ["Life", "Mana"]
+        assert rows[0]["weight"] == 5
+        assert rows[0]["is_exclusive"] is True
+        assert rows[1]["is_exclusive"] is False
+        assert replaced == 1
+
+    def test_new_essence_entries_appended(self):
+        merged, replaced = populate.merge_modifier_sources([make_mod("Life")], [make_mod("Essence Life", tier=2)])
+
+        assert [row["name"] for row in merged.values()] == ["Life", "Essence Life"]
+        assert replaced == 0
+
+    def test_missing_sources(self):
+        """Either source file may be missing (None)."""
+        merged, _ = populate.merge_modifier_sources(None, [make_mod("Life")])
+
+        assert len(merged) == 1
+        assert populate.merge_modifier_sources(None, None) == ({}, 0)
+
+
+class TestValidateSourceData:
+    """Test required-key validation of parsed source files."""
+
+    def test_valid_records_pass(self):
+        populate.validate_source_data("generated_modifiers.json", [make_mod("Life")])
+
+    def test_missing_file_passes(self):
+        populate.validate_source_data("generated_modifiers.json", None)
+
+    def test_missing_key_raises_with_index(self):
+        records = [make_mod("Life"), {"name": "Mana", "mod_type": "prefix"}]
+
+        with pytest.raises(ValueError, match=r"entry 1 is missing tier, stat_text"):
+            populate.validate_source_data("generated_modifiers.json", records)
+
+    def test_grouped_essence_effects_need_item_types(self):
+        record = {"essence_name": "Essence of the Body", "item_type": "Belt",
+                  "modifier_type": "prefix", "effect_text": "+# to maximum Life"}
+
+        with pytest.raises(ValueError, match="item_types"):
+            populate.validate_source_data("essence_item_effects.json", [record])
+
+
+class TestStoreSeedHashes:
+    """Test recording per-file seed hashes."""
+
+    def test_updates_adds_and_prunes_rows(self):
+        engine = create_engine("sqlite://")
+        SeedVersion.__table__.create(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            db.add_all([
+                SeedVersion(name="crafting", content_hash="old-whole-seed"),
+                SeedVersion(name="omens.json", content_hash="old"),
+                SeedVersion(name="gone.json", content_hash="old"),
+            ])
+            db.flush()
+
+            populate.store_seed_hashes(db, {"omens.json": "new", "essences.json": "added"})
+
+            assert populate.get_stored_seed_hashes(db) == {"omens.json": "new", "essences.json": "added"}
+
+
+class TestUpsertByName:
+    """Test the name-keyed upsert behind the essence, omen, bone and currency loaders."""
+
+    @staticmethod
+    def omen_row(name: str, effect: str = "effect") -> dict:
+        return {"name": name, "effect_description": effect, "affected_currency": "Chaos Orb",
+                "effect_type": "standard", "stack_size": 10}
+
+    def test_reseed_keeps_ids_and_prunes_removed_names(self):
+        engine = create_engine("sqlite://")
+        Omen.__table__.create(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            first = populate.upsert_by_name(
+                db, Omen, [self.omen_row(name) for name in ("Sinistral", "Dextral", "Greater")], batch_size=2
+            )
+            db.commit()
+
+            second = populate.upsert_by_name(
+                db, Omen, [self.omen_row("Sinistral", "updated"), self.omen_row("Greater")], batch_size=2
+            )
+            db.commit()
+
+            assert second == {"Sinistral": first["Sinistral"], "Greater": first["Greater"]}
+            rows = {omen.name: (omen.id, omen.effect_description) for omen in db.query(Omen)}
+            assert rows == {
+                "Sinistral": (first["Sinistral"], "updated"),
+                "Greater": (first["Greater"], "effect"),
+            }
+        engine.dispose()
+
+
+class TestSecondaryIndexesDropped:
+    """Test dropping non-unique indexes around the bulk load."""
+
+    def test_missing_index_is_skipped_and_recreated(self, tmp_path):
+        """A database lacking one of the model indexes doesn't abort the seed."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+        Modifier.__table__.create(bind=engine)
+        missing = next(index for index in Modifier.__table__.indexes if not index.unique)
+        missing.drop(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            populate.clear_existing_data(db, [Modifier.__table__])
+            with populate.secondary_indexes_dropped(db, [Modifier.__table__]):
+                index_names = {index["name"] for index in inspect(db.connection()).get_indexes("modifiers")}
+                assert not any(index.name in index_names for index in Modifier.__table__.indexes if not index.unique)
+            db.commit()
+
+        index_names = {index["name"] for index in inspect(engine).get_indexes("modifiers")}
+        assert missing.name in index_names
+        engine.dispose()
+
+
+class TestCopyRows:
+    """Test the PostgreSQL COPY path of copy_rows without a server."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, r"\N"),
+        ("plain", "plain"),
+        ("back\\slash", "back\\\\slash"),
+        ("tab\tbed", "tab\\tbed"),
+        ("new\nline", "new\\nline"),
+        ("carriage\rreturn", "carriage\\rreturn"),
+        (42, "42"),
+        (1.5, "1.5"),
+    ])
+    def test_copy_text_value(self, value, expected):
+        assert populate._copy_text_value(value) == expected
+
+    @pytest.fixture
+    def fake_postgres_db(self):
+        """A session stand-in on psycopg2 that records COPY calls."""
+        copies = []
+
+        class Cursor:
+            def copy_expert(self, sql, buffer):
+                copies.append((sql, buffer.read()))
+
+            def close(self):
+                pass
+
+        bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver="psycopg2"))
+        db = SimpleNamespace(
+            get_bind=lambda: bind,
+            connection=lambda: SimpleNamespace(connection=SimpleNamespace(cursor=Cursor)),
+            executed=[],
+        )
+        db.execute = lambda statement, rows: db.executed.append((statement, rows))
+        return db, copies
+
+    def test_scalar_table_is_copied_in_batches(self, fake_postgres_db):
+        db, copies = fake_postgres_db
+        rows = ({"omen_id": i, "rule_type": "force_prefix", "rule_value": None} for i in range(3))
+
+        assert populate.copy_rows(db, OmenRule.__table__, rows, batch_size=2) == 3
+        assert copies == [
+            ("COPY omen_rules (omen_id, rule_type, rule_value) FROM STDIN",
+             "0\tforce_prefix\t\\N\n1\tforce_prefix\t\\N\n"),
+            ("COPY omen_rules (omen_id, rule_type, rule_value) FROM STDIN",
+             "2\tforce_prefix\t\\N\n"),
+        ]
+        assert db.executed == []
+
+    def test_json_table_falls_back_to_insert(self, fake_postgres_db):
+        """Modifier has JSON and Boolean columns, which COPY text can't render."""
+        db, copies = fake_postgres_db
+
+        assert not populate._is_copy_safe(Modifier.__table__)
+        assert populate.copy_rows(db, Modifier.__table__, [make_mod("Life")]) == 1
+        assert copies == []
+        assert len(db.executed) == 1
+
+
+class TestMain:
+    """Test full population runs against a real SQLite file."""
+
+    def test_force_on_database_without_seed_versions(self, seed_engine):
+        """--force on a database created before seed_versions existed still seeds and records hashes."""
+        Base.metadata.create_all(
+            bind=seed_engine,
+            tables=[table for table in Base.metadata.sorted_tables if table.name != SeedVersion.__tablename__],
+        )
+        assert SeedVersion.__tablename__ not in inspect(seed_engine).get_table_names()
+
+        populate.main(force=True)
+
+        Session = sessionmaker(bind=seed_engine)
+        with Session() as db:
+            stored = populate.get_stored_seed_hashes(db)
+            assert stored == populate.compute_seed_hashes()
+            assert db.query(Modifier).count() > 0
+            assert db.query(Essence).count() > 0
+
+    def test_cleared_tables_are_loaded_without_their_indexes(self, seed_engine, monkeypatch):
+        """Every loader runs while the cleared tables' secondary indexes are dropped."""
+        Base.metadata.create_all(bind=seed_engine)
+        dropped_tables = []
+        covered_tables = set()
+        loaded_outside = []
+        secondary_indexes_dropped = populate.secondary_indexes_dropped
+
+        @contextmanager
+        def recording_indexes_dropped(db, tables):
+            with secondary_indexes_dropped(db, tables):
+                dropped_tables.extend(tables)
+                covered_tables.update(tables)
+                yield
+                dropped_tables.clear()
+
+        def recording_loader(loader):
+            def load(db, *data):
+                if not dropped_tables:
+                    loaded_outside.append(loader.__name__)
+                return loader(db, *data)
+            return load
+
+        monkeypatch.setattr(populate, "secondary_indexes_dropped", recording_indexes_dropped)
+        for name in ("load_base_items", "load_modifiers", "load_desecrated_modifiers", "load_currency_configs",
+                     "load_essences", "load_omens", "load_desecration_bones"):
+            monkeypatch.setattr(populate, name, recording_loader(getattr(populate, name)))
+
+        populate.main(force=True)
+
+        assert loaded_outside == []
+        assert covered_tables == set(populate.CLEARED_TABLES)
+
+    def test_missing_source_file_empties_its_tables(self, seed_engine, monkeypatch):
+        """A reload without essences.json or omens.json leaves no stale essences, omens or effects."""
+        Base.metadata.create_all(bind=seed_engine)
+        populate.main(force=True)
+
+        read_json = populate.read_json
+        missing = {"essences.json", "omens.json"}
+        monkeypatch.setattr(
+            populate, "read_json", lambda filename: None if filename in missing else read_json(filename)
+        )
+        populate.main(force=True)
+
+        Session = sessionmaker(bind=seed_engine)
+        with Session() as db:
+            assert db.query(Essence).count() == 0
+            assert db.query(EssenceItemEffect).count() == 0
+            assert db.query(Omen).count() == 0
+            assert db.query(Modifier).count() > 0
+
+    def test_sqlite_pragmas_restored_after_seed(self, seed_engine, monkeypatch):
+        """relaxed_durability leaves the seed connection with its original journal and sync settings."""
+        Base.metadata.create_all(bind=seed_engine)
+        pragmas = ("journal_mode", "synchronous")
+        with seed_engine.connect() as connection:
+            before = {pragma: connection.execute(text(f"PRAGMA {pragma}")).scalar() for pragma in pragmas}
+
+        sessions = []
+        get_db = populate.get_db
+
+        def recording_get_db():
+            for db in get_db():
+                sessions.append(db)
+                yield db
+
+        monkeypatch.setattr(populate, "get_db", recording_get_db)
+        populate.main(force=True)
+
+        [db] = sessions
+        assert {pragma: db.execute(text(f"PRAGMA {pragma}")).scalar() for pragma in pragmas} == before
+        db.close()
+
+
+class TestRelaxedDurability:
+    """Test the PostgreSQL side of relaxed_durability without a server."""
+
+    def test_postgresql_setting_is_transaction_scoped(self):
+        """SET LOCAL ends with the seed transaction, so no RESET runs on the pooled connection."""
+        statements = []
+        bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+        db = SimpleNamespace(get_bind=lambda: bind, execute=lambda statement: statements.append(str(statement)))
+
+        with populate.relaxed_durability(db):
+            pass
+
+        assert statements == ["SET LOCAL synchronous_commit = off"]